@@ -3,10 +3,131 @@
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import logging
 from datetime import datetime
 import json
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # optional, regex checks fall back to Python's re engine
+    pa = pc = ds = pq = None
+
+try:
+    import orjson
+except ImportError:  # optional, summary reports then use the stdlib json encoder
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # optional, Excel output then goes through pandas' default writer
+    xlsxwriter = None
+
+try:
+    import polars as pl
+except ImportError:  # optional, only needed for run_all_checks_lazy
+    pl = None
+
+# Define critical columns based on your dataset
+CRITICAL_COLUMNS = [
+    'timevalue', 'providerkey', 'companynameofficial',
+    'fiscalperiodend', 'operationstatustype', 'ipostatustype',
+    'geonameen', 'industrycode', 'REVENUE', 'unit_REVENUE'
+]
+
+# Define key columns for uniqueness check
+KEY_COLUMNS = ['providerkey', 'timevalue', 'fiscalperiodend']
+
+VALID_OPERATION_STATUSES = ['ACTIVE', 'INACTIVE', 'DORMANT', 'LIQUIDATION']
+VALID_IPO_STATUSES = ['PUBLIC', 'PRIVATE', 'SUBSIDIARY']
+
+# Report description of each measure; {columns} is filled with the columns it checked
+MEASURE_DESCRIPTIONS = {
+    'completeness': 'Missing values in critical columns: {columns}',
+    'consistency': 'Inconsistent formatting in company names, status types, or currency codes',
+    'validity': 'Invalid data ranges, formats, or values detected',
+    'uniqueness': 'Duplicate records based on columns: {columns}',
+}
+
+# Validation grammar; pass the patterns through _portable_regex before handing
+# them to RE2 (pyarrow) or Rust (Polars)
+# Upper-case company names may contain spaces and & . - ( ) ,
+_NAME_RE = re.compile(r'^[A-Z][A-Z\s&\.\-\(\),]*$')
+# 3-letter currency code, matched after upper-casing (the pandas checks use _is_currency_code instead)
+_CCY_RE = re.compile(r'^[A-Z]{3}$')
+# Fiscal period end like "30-Jun", "31-Dec", etc.
+_FISCAL_RE = re.compile(r'^\d{1,2}-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)$')
+# Industry code like "7010 - Description"
+_INDUSTRY_RE = re.compile(r'^\d{4}\s*-\s*.+')
+
+
+def _code_point_ranges(predicate) -> str:
+    """Regex class body (without brackets) of every code point where ``predicate`` holds."""
+    points = [c for c in range(0x110000) if predicate(chr(c))]
+    spans, start = [], points[0]
+    for prev, cur in zip(points, points[1:] + [None]):
+        if cur != prev + 1:
+            spans.append(f'\\x{{{start:x}}}' if start == prev else f'\\x{{{start:x}}}-\\x{{{prev:x}}}')
+            start = cur
+    return ''.join(spans)
+
+
+# Python re's Unicode \s and \d spelled out for RE2 and Rust, whose own classes
+# are ASCII-only or follow another Unicode version
+_PORTABLE_CLASSES = {'s': _code_point_ranges(str.isspace), 'd': _code_point_ranges(str.isdecimal)}
+
+
+@lru_cache(maxsize=None)
+def _portable_regex(pattern: str) -> str:
+    """Rewrite a Python regex so RE2 and Rust match exactly what ``re`` does.
+
+    ``\\s`` and ``\\d`` become the classes in ``_PORTABLE_CLASSES``, and ``$``
+    also matches before a trailing newline, as it does in ``re``.
+    """
+    out, in_class, i = [], False, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            escaped = pattern[i + 1]
+            if escaped in _PORTABLE_CLASSES:
+                body = _PORTABLE_CLASSES[escaped]
+                out.append(body if in_class else f'[{body}]')
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '$' and not in_class:
+            ch = r'(?:\n?\z)'
+        out.append(ch)
+        i += 1
+    return ''.join(out)
+
+
+# Python types an object column may hold when written to Parquet (the Excel
+# sidecar cache and save_results), and how to rebuild each value from the text
+# stored next to its type tag
+_OBJECT_TYPES = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': lambda text: text == 'True',
+    'datetime': datetime.fromisoformat,
+    'Timestamp': pd.Timestamp,
+}
+# Prefix of the per-value type tag column stored next to each object column
+_TYPE_TAG = '__type__'
+
+# Low-cardinality text columns held as category dtype after loading
+CATEGORICAL_COLUMNS = ['operationstatustype', 'ipostatustype', 'unit_REVENUE', 'fiscalperiodend', 'industrycode']
 
 class DataQualityChecker:
 
@@ -14,240 +135,590 @@ class DataQualityChecker:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         self.quality_issues = {}
+        # Per-measure boolean issue masks backing the counts in quality_issues
+        self._masks: Dict[str, np.ndarray] = {}
 
     def load_data(self, file_path: str) -> pd.DataFrame:
         try:
-            df = pd.read_excel(file_path)
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension == '.parquet':
+                df = self._decode_object_columns(pd.read_parquet(file_path, engine='pyarrow'))
+            elif extension == '.csv':
+                df = pd.read_csv(file_path, dtype_backend='pyarrow')
+            else:
+                df = self._read_excel_cached(file_path)
+            df = self._categoricalize(df)
+            df = self._downcast_numeric(df)
             self.logger.info(f"Data loaded successfully. Shape: {df.shape}")
             return df
         except Exception as e:
             self.logger.error(f"Error loading data: {e}")
             raise
 
-    def check_completeness(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Measure 1: Data Completeness"""
-        # Define critical columns based on your dataset
-        critical_columns = [
-            'timevalue', 'providerkey', 'companynameofficial', 
-            'fiscalperiodend', 'operationstatustype', 'ipostatustype',
-            'geonameen', 'industrycode', 'REVENUE', 'unit_REVENUE'
-        ]
-        
-        # Filter to only existing columns
-        existing_critical = [col for col in critical_columns if col in df.columns]
-        
+    def _read_excel_cached(self, file_path: str) -> pd.DataFrame:
+        """Read an Excel file, caching a Parquet sidecar so later runs skip the XML parse.
+
+        The sidecar is tied to the workbook's size and modification time, and
+        object columns are stored as text plus a per-value type tag so mixed
+        values (e.g. int and str keys, dates among strings) come back unchanged.
+        """
+        if pa is None:
+            return pd.read_excel(file_path)
+
+        sidecar_path = file_path + '.parquet'
+        stat = os.stat(file_path)
+        source = {b'source_size': str(stat.st_size).encode(), b'source_mtime_ns': str(stat.st_mtime_ns).encode()}
+        if os.path.exists(sidecar_path):
+            metadata = pq.read_schema(sidecar_path).metadata or {}
+            if all(metadata.get(key) == value for key, value in source.items()):
+                self.logger.info(f"Using cached Parquet sidecar {sidecar_path}")
+                return self._decode_object_columns(pd.read_parquet(sidecar_path, engine='pyarrow'))
+
+        df = pd.read_excel(file_path)
+        try:
+            table = pa.Table.from_pandas(self._encode_object_columns(df), preserve_index=False)
+            pq.write_table(table.replace_schema_metadata({**table.schema.metadata, **source}), sidecar_path)
+        except Exception as e:
+            self.logger.warning(f"Could not cache Parquet sidecar: {e}")
+        return df
+
+    @staticmethod
+    def _encode_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Encode object columns as text plus a type tag column that Parquet can store."""
+        encoded = df.copy()
+        for col in [col for col in df.columns if pd.api.types.is_object_dtype(df[col].dtype)]:
+            tags = df[col].map(lambda value: 'none' if value is None else type(value).__name__)
+            unsupported = set(tags.unique()) - set(_OBJECT_TYPES) - {'none'}
+            if unsupported:
+                raise TypeError(f"Column {col} holds values of type {sorted(unsupported)}")
+            encoded[col] = df[col].map(lambda value: None if value is None else str(value)).astype(object)
+            encoded[_TYPE_TAG + str(col)] = tags.astype(object)
+        return encoded
+
+    @staticmethod
+    def _decode_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Rebuild the original object columns from their text and type tags."""
+        tag_columns = [col for col in df.columns if str(col).startswith(_TYPE_TAG)]
+        for tag_col in tag_columns:
+            col = tag_col[len(_TYPE_TAG):]
+            values = [None if tag == 'none' else _OBJECT_TYPES[tag](text)
+                      for text, tag in zip(df[col].tolist(), df[tag_col].tolist())]
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        return df.drop(columns=tag_columns)
+
+    def _categoricalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the known low-cardinality text columns to category dtype."""
+        for col in CATEGORICAL_COLUMNS:
+            # Mixed-type columns (e.g. strings and dates) are left as they are
+            if col in df.columns and pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+                df[col] = df[col].astype('category')
+        return df
+
+    def _downcast_numeric(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink numeric columns to the narrowest dtype that holds their values exactly."""
+        for col in df.select_dtypes(include=[np.integer]).columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        for col in df.select_dtypes(include=[np.floating]).columns:
+            downcast = pd.to_numeric(df[col], downcast='float')
+            # float32 keeps ~7 significant digits, so skip columns that would lose precision
+            if np.array_equal(downcast.to_numpy(dtype=np.float64), df[col].to_numpy(dtype=np.float64), equal_nan=True):
+                df[col] = downcast
+        return df
+
+    @staticmethod
+    def _outside(values: pd.Series, allowed) -> pd.Series:
+        """Flag non-null values whose upper-cased form is not one of ``allowed``."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Compare once per category, then look the result up by integer code;
+            # the appended True makes the -1 (missing) code count as valid
+            valid = values.cat.categories.astype('string').str.upper().isin(allowed)
+            lookup = np.append(np.asarray(valid, dtype=bool), True)
+            return pd.Series(~lookup[values.cat.codes.to_numpy()], index=values.index)
+        upper = values.astype('string').str.upper()
+        return (upper.notna() & ~upper.isin(allowed)).fillna(False)
+
+    @staticmethod
+    def _matches(values: pd.Series, pattern: re.Pattern) -> pd.Series:
+        """Match ``pattern`` at the start of each value, keeping missing values as <NA>.
+
+        With pyarrow available the match runs in Arrow's RE2 engine over the
+        UTF-8 buffers instead of Python's backtracking ``re``.
+        """
+        if pc is None:
+            return values.astype('string').str.match(pattern)
+        text = pa.array(values.astype(pd.StringDtype('pyarrow')).array)
+        mask = pc.match_substring_regex(text, _portable_regex(pattern.pattern))
+        return pd.Series(pd.array(mask, dtype='boolean'), index=values.index)
+
+    @staticmethod
+    def _is_currency_code(values: pd.Series) -> np.ndarray:
+        """True where a value upper-cases to three ASCII letters; False for missing.
+
+        Same rule as ``re.match(r'^[A-Z]{3}$', str(value).upper())``, including the
+        trailing newline ``$`` accepts, but the three characters are compared as
+        UCS-4 code points in one NumPy pass instead of running a regex per value.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Test each category once; the appended False covers the -1 (missing) code
+            valid = DataQualityChecker._is_currency_code(pd.Series(values.cat.categories))
+            return np.append(valid, False)[values.cat.codes.to_numpy()]
+        # Python-backed strings upper-case like str.upper ('ß' -> 'SS'), Arrow's do not
+        text = values.astype(pd.StringDtype('python')).str.upper().str.removesuffix('\n')
+        has_three = text.str.len().eq(3).fillna(False).to_numpy(dtype=bool)
+        chars = text.where(has_three, '').to_numpy(dtype='U3').view(np.uint32).reshape(-1, 3)
+        letters = (chars >= ord('A')) & (chars <= ord('Z'))
+        return has_three & letters.all(axis=1)
+
+    def _critical_columns(self, columns) -> list:
+        existing_critical = [col for col in CRITICAL_COLUMNS if col in columns]
         if not existing_critical:
             self.logger.warning("No critical columns found, using first 4 columns")
-            existing_critical = df.columns[:min(4, len(df.columns))].tolist()
+            existing_critical = list(columns[:min(4, len(columns))])
+        return existing_critical
 
-        # Check for missing values in any critical column
-        missing_mask = df[existing_critical].isnull().any(axis=1)
-        df['flag_completeness'] = missing_mask.astype(int)
-
-        issues_count = missing_mask.sum()
-        self.quality_issues['completeness'] = {
-            'total_issues': int(issues_count),
-            'percentage': float(issues_count / len(df) * 100),
-            'description': f'Missing values in critical columns: {existing_critical}'
+    def _key_columns(self, columns) -> list:
+        existing_key_columns = [col for col in KEY_COLUMNS if col in columns]
+        if not existing_key_columns:
+            self.logger.warning("No key columns found for uniqueness check, using all non-flag columns")
+            existing_key_columns = [col for col in columns if not col.startswith('flag_')]
+        return existing_key_columns
+
+    @staticmethod
+    def _notna_masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Compute each critical column's non-null mask once so the checks can share it."""
+        return {col: df[col].notna().to_numpy() for col in CRITICAL_COLUMNS if col in df.columns}
+
+    @staticmethod
+    def _present(df: pd.DataFrame, col: str, notna: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """Non-null mask for ``col``, taken from ``notna`` when it has been cached."""
+        if notna is not None and col in notna:
+            return notna[col]
+        return df[col].notna().to_numpy()
+
+    def _record_measure(self, measure: str, mask: np.ndarray, columns: Optional[list] = None):
+        """Store and log one measure's issue mask; ``columns`` fills its description."""
+        self._masks[measure] = np.asarray(mask, dtype=bool)
+        issues_count = int(self._masks[measure].sum())
+        self.quality_issues[measure] = {
+            'total_issues': issues_count,
+            'percentage': float(issues_count / len(mask) * 100),
+            'description': MEASURE_DESCRIPTIONS[measure].format(columns=columns)
         }
-        
-        self.logger.info(f"Completeness check: {issues_count} issues found ({issues_count/len(df)*100:.2f}%)")
+        self.logger.info(f"{measure.capitalize()} check: {issues_count} issues found ({issues_count/len(mask)*100:.2f}%)")
+
+    def check_completeness(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
+        """Measure 1: Data Completeness"""
+        df['flag_completeness'] = self._check_completeness(df, notna)
         return df
 
-    def check_consistency(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _check_completeness(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        # Filter to only existing columns
+        existing_critical = self._critical_columns(df.columns)
+
+        # Check for missing values in any critical column
+        missing_mask = ~np.logical_and.reduce([self._present(df, col, notna) for col in existing_critical])
+        self._record_measure('completeness', missing_mask, existing_critical)
+        return missing_mask.astype(np.int8)
+
+    def check_consistency(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """Measure 2: Data Consistency """
-        consistency_flags = []
-        
-        for _, row in df.iterrows():
-            flag = 0
-            
-            # Check company name consistency
-            if 'companynameofficial' in df.columns and pd.notna(row['companynameofficial']):
-                company_name = str(row['companynameofficial'])
-                # Check for inconsistent capitalization or special characters
-                if not (company_name.isupper() or company_name.istitle()):
-                    if not re.match(r'^[A-Z][A-Z\s&\.\-\(\),]*$', company_name):
-                        flag = 1
-            
-            # Check operation status consistency
-            if 'operationstatustype' in df.columns and pd.notna(row['operationstatustype']):
-                status = str(row['operationstatustype']).upper()
-                if status not in ['ACTIVE', 'INACTIVE', 'DORMANT', 'LIQUIDATION']:
-                    flag = 1
-            
-            # Check IPO status consistency
-            if 'ipostatustype' in df.columns and pd.notna(row['ipostatustype']):
-                ipo_status = str(row['ipostatustype']).upper()
-                if ipo_status not in ['PUBLIC', 'PRIVATE', 'SUBSIDIARY']:
-                    flag = 1
-            
-            # Check currency unit consistency
-            if 'unit_REVENUE' in df.columns and pd.notna(row['unit_REVENUE']):
-                currency = str(row['unit_REVENUE']).upper()
-                if not re.match(r'^[A-Z]{3}$', currency):  # 3-letter currency code
-                    flag = 1
-            
-            consistency_flags.append(flag)
-
-        df['flag_consistency'] = consistency_flags
-        issues_count = sum(consistency_flags)
-        self.quality_issues['consistency'] = {
-            'total_issues': issues_count,
-            'percentage': float(issues_count / len(df) * 100),
-            'description': 'Inconsistent formatting in company names, status types, or currency codes'
-        }
-        
-        self.logger.info(f"Consistency check: {issues_count} issues found ({issues_count/len(df)*100:.2f}%)")
+        df['flag_consistency'] = self._check_consistency(df, notna)
         return df
 
-    def check_validity(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _check_consistency(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        inconsistent = pd.Series(False, index=df.index)
+
+        # Check company name consistency
+        if 'companynameofficial' in df.columns:
+            company_name = df['companynameofficial'].astype('string')
+            # Check for inconsistent capitalization or special characters
+            bad_name = (self._present(df, 'companynameofficial', notna)
+                        & ~(company_name.str.isupper() | company_name.str.istitle())
+                        & ~self._matches(company_name, _NAME_RE))
+            inconsistent |= bad_name.fillna(False)
+
+        # Check operation status consistency
+        if 'operationstatustype' in df.columns:
+            inconsistent |= self._outside(df['operationstatustype'], VALID_OPERATION_STATUSES)
+
+        # Check IPO status consistency
+        if 'ipostatustype' in df.columns:
+            inconsistent |= self._outside(df['ipostatustype'], VALID_IPO_STATUSES)
+
+        # Check currency unit consistency
+        if 'unit_REVENUE' in df.columns:
+            # 3-letter currency code
+            bad_ccy = self._present(df, 'unit_REVENUE', notna) & ~self._is_currency_code(df['unit_REVENUE'])
+            inconsistent |= bad_ccy
+
+        consistency_flags = inconsistent.to_numpy(dtype=np.int8)
+        self._record_measure('consistency', consistency_flags)
+        return consistency_flags
+
+    def check_validity(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
         """Measure 3: Data Validity """
-        validity_flags = []
-        
-        for _, row in df.iterrows():
-            flag = 0
-            
-            # Check timevalue (year) validity
-            if 'timevalue' in df.columns and pd.notna(row['timevalue']):
-                try:
-                    year = int(row['timevalue'])
-                    if not (1900 <= year <= 2030):
-                        flag = 1
-                except (ValueError, TypeError):
-                    flag = 1
-            
-            # Check REVENUE validity
-            if 'REVENUE' in df.columns and pd.notna(row['REVENUE']):
-                try:
-                    revenue = float(row['REVENUE'])
-                    # Revenue should be non-negative and within reasonable bounds
-                    if revenue < 0 or revenue > 1e15:  # 1 quadrillion limit
-                        flag = 1
-                except (ValueError, TypeError):
-                    flag = 1
-            
-            # Check fiscal period end format (should be valid date format)
-            if 'fiscalperiodend' in df.columns and pd.notna(row['fiscalperiodend']):
-                fiscal_date = str(row['fiscalperiodend'])
-                # Check for common date patterns like "30-Jun", "31-Dec", etc.
-                if not re.match(r'^\d{1,2}-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)$', fiscal_date):
-                    flag = 1
-            
-            # Check industry code format
-            if 'industrycode' in df.columns and pd.notna(row['industrycode']):
-                industry = str(row['industrycode'])
-                # Industry code should follow pattern like "7010 - Description"
-                if not re.match(r'^\d{4}\s*-\s*.+', industry):
-                    flag = 1
-            
-            validity_flags.append(flag)
-
-        df['flag_validity'] = validity_flags
-        issues_count = sum(validity_flags)
-        self.quality_issues['validity'] = {
-            'total_issues': issues_count,
-            'percentage': float(issues_count / len(df) * 100),
-            'description': 'Invalid data ranges, formats, or values detected'
-        }
-        
-        self.logger.info(f"Validity check: {issues_count} issues found ({issues_count/len(df)*100:.2f}%)")
+        df['flag_validity'] = self._check_validity(df, notna)
         return df
 
+    def _check_validity(self, df: pd.DataFrame, notna: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        invalid = pd.Series(False, index=df.index)
+
+        # Check timevalue (year) validity
+        if 'timevalue' in df.columns:
+            year = pd.to_numeric(df['timevalue'], errors='coerce')
+            bad_year = self._present(df, 'timevalue', notna) & (year.isna() | (year < 1900) | (year > 2030))
+            invalid |= bad_year
+
+        # Check REVENUE validity
+        if 'REVENUE' in df.columns:
+            revenue = pd.to_numeric(df['REVENUE'], errors='coerce')
+            # Revenue should be non-negative and within reasonable bounds
+            bad_revenue = self._present(df, 'REVENUE', notna) & (revenue.isna() | (revenue < 0) | (revenue > 1e15))  # 1 quadrillion limit
+            invalid |= bad_revenue
+
+        # Check fiscal period end format (should be valid date format)
+        if 'fiscalperiodend' in df.columns:
+            fiscal_date = df['fiscalperiodend'].astype('string')
+            # Check for common date patterns like "30-Jun", "31-Dec", etc.
+            bad_fiscal = self._present(df, 'fiscalperiodend', notna) & ~self._matches(fiscal_date, _FISCAL_RE)
+            invalid |= bad_fiscal.fillna(False)
+
+        # Check industry code format
+        if 'industrycode' in df.columns:
+            industry = df['industrycode'].astype('string')
+            # Industry code should follow pattern like "7010 - Description"
+            bad_industry = self._present(df, 'industrycode', notna) & ~self._matches(industry, _INDUSTRY_RE)
+            invalid |= bad_industry.fillna(False)
+
+        validity_flags = invalid.to_numpy(dtype=np.int8)
+        self._record_measure('validity', validity_flags)
+        return validity_flags
+
     def check_uniqueness(self, df: pd.DataFrame) -> pd.DataFrame:
         """Measure 4: Data Uniqueness """
-        # Define key columns for uniqueness check
-        key_columns = ['providerkey', 'timevalue', 'fiscalperiodend']
-        
-        # Filter to only existing columns
-        existing_key_columns = [col for col in key_columns if col in df.columns]
-        
-        if not existing_key_columns:
-            self.logger.warning("No key columns found for uniqueness check, using all non-flag columns")
-            existing_key_columns = [col for col in df.columns if not col.startswith('flag_')]
+        df['flag_uniqueness'] = self._check_uniqueness(df)
+        return df
 
-        # Check for duplicates
-        duplicate_mask = df.duplicated(subset=existing_key_columns, keep=False)
-        df['flag_uniqueness'] = duplicate_mask.astype(int)
+    @staticmethod
+    def _row_keys(df: pd.DataFrame, key_columns: List[str]) -> pd.Series:
+        """Hash each row's composite key into one uint64.
 
-        issues_count = duplicate_mask.sum()
-        self.quality_issues['uniqueness'] = {
-            'total_issues': int(issues_count),
-            'percentage': float(issues_count / len(df) * 100),
-            'description': f'Duplicate records based on columns: {existing_key_columns}'
-        }
-        
-        self.logger.info(f"Uniqueness check: {issues_count} issues found ({issues_count/len(df)*100:.2f}%)")
-        return df
+        Object values are hashed by their string form (19457 and '19457' collide),
+        so this is only exact for typed key columns.
+        """
+        return pd.util.hash_pandas_object(df[key_columns], index=False)
+
+    def _duplicate_mask(self, df: pd.DataFrame, key_columns: List[str]) -> np.ndarray:
+        """Mark every row whose composite key occurs more than once."""
+        if any(pd.api.types.is_object_dtype(df[col].dtype) for col in key_columns):
+            # Mixed-type keys need pandas' value comparison, which hashing by str() would lose
+            return df.duplicated(subset=key_columns, keep=False).to_numpy()
+        # Typed keys: duplicated(keep=False) over a single 64-bit hash of the
+        # composite key marks all members in one hashtable pass
+        return self._row_keys(df, key_columns).duplicated(keep=False).to_numpy()
+
+    def _check_uniqueness(self, df: pd.DataFrame) -> np.ndarray:
+        existing_key_columns = self._key_columns(df.columns)
+
+        duplicate_mask = self._duplicate_mask(df, existing_key_columns)
+        self._record_measure('uniqueness', duplicate_mask, existing_key_columns)
+        return duplicate_mask.astype(np.int8)
+
+    def _attach_flags(self, df: pd.DataFrame, flags: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Add flag_overall and append all flag columns in one concat.
+
+        Flag columns left over from an earlier run are replaced.
+        """
+        # Add overall quality flag (1 if any issue exists)
+        flags['flag_overall'] = np.bitwise_or.reduce(np.vstack(list(flags.values())), axis=0)
+        return pd.concat([df.drop(columns=list(flags), errors='ignore'),
+                          pd.DataFrame(flags, index=df.index)], axis=1)
 
     def run_all_checks(self, df: pd.DataFrame) -> pd.DataFrame:
         self.logger.info("Starting data quality checks...")
         
-        # Run all quality measures
-        df = self.check_completeness(df)
-        df = self.check_consistency(df)
-        df = self.check_validity(df)
-        df = self.check_uniqueness(df)
-        
-        # Add overall quality flag (1 if any issue exists)
-        flag_columns = [col for col in df.columns if col.startswith('flag_')]
-        df['flag_overall'] = df[flag_columns].max(axis=1)
-        
+        # Null masks shared by completeness, consistency and validity
+        notna = self._notna_masks(df)
+
+        # Run all quality measures, then attach their flags (and flag_overall) in a single concat
+        flags = {
+            'flag_completeness': self._check_completeness(df, notna),
+            'flag_consistency': self._check_consistency(df, notna),
+            'flag_validity': self._check_validity(df, notna),
+            'flag_uniqueness': self._check_uniqueness(df),
+        }
+        df = self._attach_flags(df, flags)
+
         self.logger.info("All data quality checks completed.")
         return df
 
-    def generate_quality_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def run_streaming(self, file_path: str, chunksize: int = 200_000,
+                      output_dir: Optional[str] = None) -> Iterator[Tuple[pd.DataFrame, Dict[str, int]]]:
+        """Run all checks chunk by chunk over a CSV or Parquet file.
+
+        Yields ``(chunk_with_flags, partial_counts)`` for each chunk, where
+        ``partial_counts`` maps each measure to its issue count in that chunk.
+        With ``output_dir`` set, every flagged chunk is also written there as one
+        part of a Parquet dataset; the directory must be new or empty. Once
+        exhausted, ``quality_issues`` holds the totals merged over all chunks.
+        The uniqueness total covers the whole file (row key hashes are kept
+        across chunks), while ``flag_uniqueness`` in each yielded chunk only
+        reflects duplicates within that chunk. CSV key columns are read as text
+        so their type does not depend on which values a chunk happens to hold.
+        """
+        if output_dir is not None and os.path.isdir(output_dir) and os.listdir(output_dir):
+            raise ValueError(f"Output directory {output_dir} is not empty")
+
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.csv':
+            # Pin the key columns to text so every chunk hashes (and writes) them
+            # alike, instead of one chunk inferring ints and the next strings
+            key_columns = self._key_columns(pd.read_csv(file_path, nrows=0).columns)
+            chunks = pd.read_csv(file_path, chunksize=chunksize, dtype_backend='pyarrow',
+                                 dtype={col: pd.ArrowDtype(pa.string()) for col in key_columns})
+        elif extension == '.parquet':
+            chunks = (batch.to_pandas() for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunksize))
+        else:
+            raise ValueError(f"Streaming checks need CSV or Parquet input, got {file_path}")
+
+        total_records = 0
+        totals: Dict[str, int] = {}
+        descriptions: Dict[str, str] = {}
+        row_keys = []
+        for part, chunk in enumerate(chunks):
+            row_keys.append(self._row_keys(chunk, self._key_columns(chunk.columns)).to_numpy())
+            chunk = self.run_all_checks(chunk)
+            partial_counts = {measure: details['total_issues'] for measure, details in self.quality_issues.items()}
+            for measure, issues_count in partial_counts.items():
+                totals[measure] = totals.get(measure, 0) + issues_count
+                descriptions[measure] = self.quality_issues[measure]['description']
+            total_records += len(chunk)
+
+            if output_dir is not None:
+                ds.write_dataset(pa.Table.from_pandas(self._encode_object_columns(chunk), preserve_index=False),
+                                 output_dir, format='parquet',
+                                 basename_template=f'part-{part}-{{i}}.parquet',
+                                 existing_data_behavior='overwrite_or_ignore')
+            yield chunk, partial_counts
+
+        # Duplicates can span chunks, so recount them over every row's key hash
+        if row_keys:
+            totals['uniqueness'] = int(pd.Series(np.concatenate(row_keys)).duplicated(keep=False).sum())
+
+        # Per-chunk masks do not cover the whole file; the summary falls back to the merged counts
+        self._masks = {}
+        self.quality_issues = {
+            measure: {
+                'total_issues': issues_count,
+                'percentage': float(issues_count / total_records * 100) if total_records else 0.0,
+                'description': descriptions[measure]
+            }
+            for measure, issues_count in totals.items()
+        }
+        self.logger.info(f"Streaming checks completed over {total_records} records")
+
+    def run_all_checks_lazy(self, df: pd.DataFrame, to_pandas: bool = True):
+        """Run all four measures as a single Polars LazyFrame query.
+
+        The rules are expressed as Polars expressions inside one ``with_columns``
+        so the query is collected in a single pass. Returns a pandas DataFrame
+        unless ``to_pandas`` is False, in which case the Polars frame is returned.
+        """
+        if pl is None:
+            raise ImportError("polars is required for run_all_checks_lazy")
+
+        self.logger.info("Starting data quality checks (Polars lazy pipeline)...")
+
+        # Mixed-type object columns (e.g. int and str keys) have no single Arrow type
+        object_columns = df.select_dtypes(include=['object', 'str', 'category']).columns
+        lf = pl.from_pandas(df.astype({col: 'string' for col in object_columns})).lazy()
+        columns = list(df.columns)
+
+        existing_critical = self._critical_columns(columns)
+        existing_key_columns = self._key_columns(columns)
+
+        # Object key columns are text now (19457 and '19457' would collide), so
+        # their duplicates come from the pandas check instead
+        if any(pd.api.types.is_object_dtype(df[col].dtype) for col in existing_key_columns):
+            duplicates = pl.lit(pl.Series(self._duplicate_mask(df, existing_key_columns)))
+        else:
+            duplicates = pl.struct(existing_key_columns).is_duplicated()
+
+        def text(col):
+            return pl.col(col).cast(pl.String)
+
+        def number(col):
+            return pl.col(col).cast(pl.Float64, strict=False)
+
+        # Python's str.isupper / str.istitle expressed as regexes
+        cased = r'[\p{Lu}\p{Ll}\p{Lt}]'
+        def is_upper(expr):
+            return expr.str.contains(r'[\p{Lu}\p{Lt}]') & ~expr.str.contains(r'\p{Ll}')
+
+        def is_title(expr):
+            return (expr.str.contains(cased)
+                    & ~expr.str.contains(cased + r'[\p{Lu}\p{Lt}]')
+                    & ~expr.str.contains(r'(^|[^\p{Lu}\p{Ll}\p{Lt}])\p{Ll}'))
+
+        # Measure 2: each rule only fires for non-null values, so nulls fall through to False
+        consistency_rules = []
+        if 'companynameofficial' in columns:
+            name = text('companynameofficial')
+            consistency_rules.append(~(is_upper(name) | is_title(name))
+                                     & ~name.str.contains(_portable_regex(_NAME_RE.pattern)))
+        if 'operationstatustype' in columns:
+            consistency_rules.append(~text('operationstatustype').str.to_uppercase().is_in(VALID_OPERATION_STATUSES))
+        if 'ipostatustype' in columns:
+            consistency_rules.append(~text('ipostatustype').str.to_uppercase().is_in(VALID_IPO_STATUSES))
+        if 'unit_REVENUE' in columns:
+            consistency_rules.append(~text('unit_REVENUE').str.to_uppercase()
+                                     .str.contains(_portable_regex(_CCY_RE.pattern)))
+
+        # Measure 3
+        validity_rules = []
+        if 'timevalue' in columns:
+            year = number('timevalue')
+            validity_rules.append(pl.col('timevalue').is_not_null()
+                                  & (year.is_null() | (year < 1900) | (year > 2030)))
+        if 'REVENUE' in columns:
+            revenue = number('REVENUE')
+            validity_rules.append(pl.col('REVENUE').is_not_null()
+                                  & (revenue.is_null() | (revenue < 0) | (revenue > 1e15)))
+        if 'fiscalperiodend' in columns:
+            validity_rules.append(~text('fiscalperiodend').str.contains(_portable_regex(_FISCAL_RE.pattern)))
+        if 'industrycode' in columns:
+            validity_rules.append(~text('industrycode').str.contains(_portable_regex(_INDUSTRY_RE.pattern)))
+
+        def flag(rules):
+            if not rules:
+                return pl.lit(0, dtype=pl.Int8)
+            return pl.any_horizontal(rules).fill_null(False).cast(pl.Int8)
+
+        flag_columns = ['flag_completeness', 'flag_consistency', 'flag_validity', 'flag_uniqueness']
+        result = (
+            lf.with_columns(
+                flag_completeness=flag([pl.col(col).is_null() for col in existing_critical]),
+                flag_consistency=flag(consistency_rules),
+                flag_validity=flag(validity_rules),
+                flag_uniqueness=flag([duplicates]),
+            )
+            .with_columns(flag_overall=pl.max_horizontal(flag_columns))
+            .collect(engine='streaming')
+        )
+
+        checked_columns = {'completeness': existing_critical, 'uniqueness': existing_key_columns}
+        for col in flag_columns:
+            measure = col[len('flag_'):]
+            self._record_measure(measure, result[col].to_numpy(), checked_columns.get(measure))
+
+        self.logger.info("All data quality checks completed.")
+        if not to_pandas:
+            return result
+        return self._attach_flags(df, {col: result.get_column(col).to_numpy() for col in flag_columns})
+
+    def generate_quality_summary(self, df: pd.DataFrame, total_records: Optional[int] = None) -> Dict[str, Any]:
+        """Build the summary report; ``total_records`` overrides ``len(df)`` when ``df``
+        is only part of the checked data, e.g. the last chunk from ``run_streaming``."""
+        if total_records is None:
+            total_records = len(df)
         summary = {
-            'total_records': len(df),
+            'total_records': total_records,
             'quality_measures': self.quality_issues,
             'overall_quality_score': 0,
             'timestamp': datetime.now().isoformat(),
             'dataset_info': {
                 'columns': list(df.columns),
-                'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()}
+                'data_types': df.dtypes.astype(str).to_dict()
             }
         }
 
         # Calculate overall quality score
-        total_issues = sum(measure.get('total_issues', 0) for measure in self.quality_issues.values())
-        total_possible_issues = len(df) * len(self.quality_issues)
+        if self._masks:
+            total_issues = int(np.add.reduce([mask.sum() for mask in self._masks.values()]))
+        else:
+            total_issues = sum(measure.get('total_issues', 0) for measure in self.quality_issues.values())
+        total_possible_issues = total_records * len(self.quality_issues)
         if total_possible_issues > 0:
             summary['overall_quality_score'] = max(0, 100 - (total_issues / total_possible_issues * 100))
 
         return summary
 
-    def save_results(self, df: pd.DataFrame, output_path: str = 'quality_checked_data.xlsx'):
+    def save_results(self, df: pd.DataFrame, output_path: str = 'quality_checked_data.parquet'):
+        """Save flagged data; Excel is only written when the path explicitly asks for it."""
         try:
-            df.to_excel(output_path, index=False)
+            extension = os.path.splitext(output_path)[1].lower()
+            if extension == '.xlsx' and xlsxwriter is not None:
+                self._write_excel_streaming(df, output_path)
+            elif extension in ('.xlsx', '.xls'):
+                df.to_excel(output_path, index=False)
+            elif extension == '.csv':
+                df.to_csv(output_path, index=False, lineterminator='\n')
+            else:
+                # Mixed-type object columns (e.g. int and str keys) have no single Arrow type
+                self._encode_object_columns(df).to_parquet(output_path, engine='pyarrow', index=False)
             self.logger.info(f"Results saved to {output_path}")
         except Exception as e:
             self.logger.error(f"Error saving results: {e}")
             raise
 
+    def _write_excel_streaming(self, df: pd.DataFrame, output_path: str):
+        """Write an .xlsx file row by row with xlsxwriter's constant-memory mode.
+
+        pandas' ExcelWriter emits cells column by column, which constant_memory
+        mode silently truncates, so the rows are written here directly.
+        """
+        # xlsxwriter silently skips cells past Excel's sheet limits; the header takes one row
+        max_rows, max_cols = 1048576, 16384
+        if len(df) + 1 > max_rows or len(df.columns) > max_cols:
+            raise ValueError(f"This sheet is too large! Your sheet size is: {len(df) + 1}, {len(df.columns)} "
+                             f"Max sheet size is: {max_rows}, {max_cols}")
+
+        def cell(value):
+            if pd.isna(value):
+                return None
+            # Excel has no infinity; write it as text like to_excel's inf_rep
+            if isinstance(value, (float, np.floating)) and np.isinf(value):
+                return 'inf' if value > 0 else '-inf'
+            return value
+
+        workbook = xlsxwriter.Workbook(output_path, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'remove_timezone': True,
+        })
+        try:
+            worksheet = workbook.add_worksheet('Sheet1')
+            worksheet.write_row(0, 0, [str(col) for col in df.columns])
+            for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_idx, 0, [cell(value) for value in row])
+        finally:
+            workbook.close()
+
     def save_summary_report(self, summary: Dict[str, Any], output_path: str = 'quality_summary.json'):
         """Save the quality summary to a JSON file."""
         try:
-            # Convert numpy and pandas types to Python types for JSON serialization
+            # Convert numpy and pandas types to Python types; the encoder only calls
+            # this for objects it cannot serialize natively
             def convert_types(obj):
                 if isinstance(obj, np.integer):
                     return int(obj)
                 elif isinstance(obj, np.floating):
                     return float(obj)
+                elif isinstance(obj, np.bool_):
+                    return bool(obj)
                 elif isinstance(obj, np.ndarray):
                     return obj.tolist()
-                elif str(type(obj)).startswith("<class 'pandas."):  # Handle pandas data types
+                elif type(obj).__module__.startswith(('pandas', 'numpy')):  # Handle pandas data types
                     return str(obj)
-                elif hasattr(obj, '__module__') and obj.__module__ and 'pandas' in obj.__module__:
-                    return str(obj)
-                elif isinstance(obj, dict):
-                    return {k: convert_types(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_types(item) for item in obj]
-                return obj
-            
-            summary_converted = convert_types(summary)
-            
-            with open(output_path, 'w') as f:
-                json.dump(summary_converted, f, indent=2)
+                raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+            if orjson is not None:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(summary, default=convert_types, option=options))
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(summary, f, indent=2, default=convert_types)
             self.logger.info(f"Summary report saved to {output_path}")
         except Exception as e:
             self.logger.error(f"Error saving summary: {e}")
@@ -0,0 +1,115 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import data_quality
+from data_quality import DataQualityChecker
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'CaseStudy_Quality_sample25.xlsx')
+
+
+@pytest.fixture
+def sample():
+    return pd.read_excel(SAMPLE_PATH)
+
+
+def flag_values(df):
+    return df[[col for col in df.columns if col.startswith('flag_')]]
+
+
+@pytest.mark.skipif(data_quality.pl is None, reason='polars is not installed')
+def test_lazy_pipeline_flags_the_same_rows(sample):
+    # Whitespace, digits and case mappings outside ASCII, and a trailing newline, which $ accepts
+    edge_cases = pd.concat([sample.head(1)] * 4, ignore_index=True)
+    edge_cases['industrycode'] = ['7010\xa0- A', '７０１０ - A', '7010 - A\n', '7010\x1c- A']
+    edge_cases['fiscalperiodend'] = ['30-Jun\n', '３０-Jun', '30\xa0-Jun', '30-Jun\n\n']
+    edge_cases['unit_REVENUE'] = ['USD\n', 'usd\n\n', 'ßx', '\u212aaa']
+    df = pd.concat([sample, edge_cases], ignore_index=True)
+
+    expected = DataQualityChecker().run_all_checks(df.copy())
+    result = DataQualityChecker().run_all_checks_lazy(df.copy())
+
+    pd.testing.assert_frame_equal(flag_values(result), flag_values(expected), check_dtype=False)
+
+
+@pytest.mark.parametrize('pattern', [data_quality._NAME_RE, data_quality._FISCAL_RE, data_quality._INDUSTRY_RE])
+def test_matches_follows_python_re(pattern):
+    values = pd.Series(['7010\xa0- A', '７０１０ - A', '7010\x1c- A', '30-Jun\n', '３０-Jun', '30-Jun\n\n',
+                        'ACME CORP', 'ACME CORP\n', 'Acme'])
+
+    expected = [pattern.match(value) is not None for value in values]
+
+    assert DataQualityChecker._matches(values, pattern).tolist() == expected
+
+
+def test_currency_code_follows_upper_cased_regex():
+    values = pd.Series(['USD', 'usd', 'USD\n', 'USD\n\n', 'ßx', '\u212aaa', 'ÄBC', 'US', '123', None], dtype=object)
+
+    expected = [value is not None and re.match(r'^[A-Z]{3}$', str(value).upper()) is not None for value in values]
+
+    assert DataQualityChecker._is_currency_code(values).tolist() == expected
+    assert DataQualityChecker._is_currency_code(values.astype('category')).tolist() == expected
+
+
+def test_uniqueness_matches_dataframe_duplicated_on_mixed_keys():
+    df = pd.DataFrame({
+        'providerkey': pd.Series([1, 1.0, 19457, '19457', None, np.nan, 'A', 'A'], dtype=object),
+        'timevalue': [2020] * 8,
+        'fiscalperiodend': ['30-Jun'] * 8,
+    })
+    expected = df.duplicated(subset=data_quality.KEY_COLUMNS, keep=False).astype(int).tolist()
+
+    assert DataQualityChecker().run_all_checks(df.copy())['flag_uniqueness'].tolist() == expected
+    if data_quality.pl is not None:
+        assert DataQualityChecker().run_all_checks_lazy(df.copy())['flag_uniqueness'].tolist() == expected
+
+
+def test_parquet_results_round_trip_mixed_type_columns(sample, tmp_path):
+    checker = DataQualityChecker()
+    checked = checker.run_all_checks(sample)
+    output_path = str(tmp_path / 'checked.parquet')
+
+    checker.save_results(checked, output_path)
+    loaded = pd.read_parquet(output_path).pipe(checker._decode_object_columns)
+
+    assert list(loaded.columns) == list(checked.columns)
+    assert loaded['providerkey'].tolist() == checked['providerkey'].tolist()
+    assert loaded['providerkey'].map(type).tolist() == checked['providerkey'].map(type).tolist()
+
+
+def test_excel_results_write_infinite_values_like_to_excel(tmp_path):
+    df = pd.DataFrame({'REVENUE': [np.inf, -np.inf, 1.5, np.nan]})
+    DataQualityChecker().save_results(df, str(tmp_path / 'checked.xlsx'))
+    df.to_excel(tmp_path / 'expected.xlsx', index=False)
+
+    pd.testing.assert_frame_equal(pd.read_excel(tmp_path / 'checked.xlsx'), pd.read_excel(tmp_path / 'expected.xlsx'))
+
+
+def test_excel_results_refuse_frames_beyond_the_sheet_limit(tmp_path):
+    df = pd.DataFrame({'flag_overall': np.zeros(1048576, dtype=np.int8)})
+
+    with pytest.raises(ValueError, match='too large'):
+        DataQualityChecker().save_results(df, str(tmp_path / 'checked.xlsx'))
+    assert not (tmp_path / 'checked.xlsx').exists()
+
+
+def test_streaming_counts_duplicates_across_chunks_with_drifting_key_types(tmp_path):
+    # The first chunk's keys look numeric and the second's do not
+    csv_path = tmp_path / 'keys.csv'
+    csv_path.write_text('providerkey,timevalue,fiscalperiodend\n'
+                        '100,2020,30-Jun\n101,2020,30-Jun\n'
+                        '100,2020,30-Jun\nABC,2020,30-Jun\n')
+    output_dir = tmp_path / 'checked'
+    checker = DataQualityChecker()
+
+    chunks = [chunk for chunk, _ in checker.run_streaming(str(csv_path), chunksize=2, output_dir=str(output_dir))]
+
+    assert len(chunks) == 2
+    expected = int(pd.read_csv(csv_path).duplicated(keep=False).sum())
+    assert checker.quality_issues['uniqueness']['total_issues'] == expected == 2
+    schemas = {str(pq.read_schema(path)) for path in output_dir.glob('*.parquet')}
+    assert len(schemas) == 1